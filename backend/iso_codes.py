@@ -1,5 +1,10 @@
 """ISO 2-letter country codes for flag CDN (flagcdn.com/w80/{code}.png)"""
 
+import sys
+import unicodedata
+from functools import lru_cache
+from types import MappingProxyType
+
 ISO_CODES = {
     # A
     'Afghanistan': 'af', 'Albania': 'al', 'Algeria': 'dz', 'American Samoa': 'as',
@@ -108,11 +113,69 @@ ISO_CODES = {
     'Guinea Bissau': 'gw', 'São Tomé e Príncipe': 'st',
 }
 
+# Intern the keys so lookups with interned names reuse the cached string
+# hash, then freeze the table so nothing mutates it after import.
+ISO_CODES = MappingProxyType({sys.intern(k): v for k, v in ISO_CODES.items()})
+
+def _canon(name: str) -> str:
+    """Normalize a country name: strip diacritics, casefold."""
+    return unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().casefold()
+
+
+# Canonicalized lookup table: collapses spelling variants that differ only in
+# diacritics or case ('São Tomé and Príncipe' / 'Sao Tome and Principe',
+# 'Curaçao' / 'Curacao', ...) into one entry each, so names that miss the
+# exact-match table still resolve without per-variant aliases.
+_CANON_ISO = {}
+for _name, _code in ISO_CODES.items():
+    _CANON_ISO.setdefault(_canon(_name), _code)
+_CANON_ISO = MappingProxyType(_CANON_ISO)
+
+# Precomputed flag URLs for every known country at the default width (80px,
+# the only width the API uses). The hot path becomes a single dict lookup
+# returning a cached string -- no f-string, no .lower(), no slicing.
+_URL_CACHE_W80 = MappingProxyType({
+    name: f"https://flagcdn.com/w80/{code}.png" for name, code in ISO_CODES.items()
+})
+
+
 def get_iso_code(country_name: str) -> str:
     """Get ISO 2-letter code for a country name."""
-    return ISO_CODES.get(country_name, country_name.lower()[:2])
+    # .get with a computed default would evaluate lower()[:2] on every hit;
+    # the except path only pays for it on a miss.
+    try:
+        return ISO_CODES[country_name]
+    except KeyError:
+        return _CANON_ISO.get(_canon(country_name), country_name.lower()[:2])
+
+
+def _build_flag_url(country_name: str, width: int) -> str:
+    """Build a flag URL from scratch (fallback for unknown countries/widths)."""
+    return f"https://flagcdn.com/w{width}/{get_iso_code(country_name)}.png"
+
+
+@lru_cache(maxsize=None)
+def _url_cache(width: int) -> dict:
+    """Precomputed flag URLs for a non-default width, built on first use."""
+    return {
+        name: f"https://flagcdn.com/w{width}/{code}.png"
+        for name, code in ISO_CODES.items()
+    }
+
 
 def get_flag_url(country_name: str, width: int = 80) -> str:
     """Get flag CDN URL for a country."""
-    iso_code = get_iso_code(country_name)
-    return f"https://flagcdn.com/w{width}/{iso_code}.png"
+    cache = _URL_CACHE_W80 if width == 80 else _url_cache(width)
+    return cache.get(country_name) or _build_flag_url(country_name, width)
+
+
+def get_flag_urls(country_names, width: int = 80) -> list:
+    """
+    Get flag CDN URLs for many countries at once.
+
+    Batched variant of get_flag_url: binds the cache lookup once and runs a
+    single list comprehension instead of paying the per-call function and
+    width-dispatch overhead ~200 times when materializing the team list.
+    """
+    lookup = (_URL_CACHE_W80 if width == 80 else _url_cache(width)).get
+    return [lookup(name) or _build_flag_url(name, width) for name in country_names]
@@ -4,20 +4,60 @@ World Cup Predictor API
 FastAPI backend for the World Cup prediction web application.
 """
 
-from typing import Dict, List, Optional
-
-from fastapi import FastAPI, HTTPException
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from predictor import predictor
-from iso_codes import get_flag_url
+from iso_codes import get_flag_urls
+
+logger = logging.getLogger("worldcup.api")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Preload models and warm caches/code paths before serving traffic."""
+    global _TEAMS_JSON_CACHE, _MODEL_INFO_JSON
+    try:
+        await asyncio.to_thread(predictor.load_models)
+        await asyncio.to_thread(_warm_prediction)
+        _TEAMS_JSON_CACHE = _build_teams_cache()
+        _MODEL_INFO_JSON = _build_model_info_json()
+        for preset_name in sorted(_VALID_PRESETS):
+            _load_preset_cached(preset_name)
+        print("Models loaded successfully on startup")
+    except Exception as e:
+        print(f"Warning: Could not preload models: {e}")
+        print("Models will be loaded on first request")
+    _predict_batcher.start()
+    yield
+    await _predict_batcher.stop()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="World Cup Predictor API",
     description="API for predicting World Cup match outcomes and simulating tournaments",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -28,15 +68,38 @@ origins = [
     "http://127.0.0.1:5173",
 ]
 
-# Configure CORS for frontend
+# Configure CORS for frontend. The API only serves GET/POST with JSON
+# bodies, so the allowlist is narrowed to exactly that -- simple requests
+# skip preflight entirely -- and browsers cache the remaining preflights
+# for a day instead of re-issuing OPTIONS per route.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,  # In production, replace with specific frontend URL
+    allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "if-none-match"],
+    max_age=86400,
 )
 
+# Compress larger responses (team list, simulation brackets/histograms are
+# repetitive JSON that compresses well); small payloads skip the overhead.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request, exc):
+    """
+    Log unexpected errors once (with a correlation id) and return a static
+    message. Keeps exception details out of responses and avoids stringifying
+    large Pandas/XGBoost reprs into HTTPException details.
+    """
+    error_id = uuid.uuid4().hex
+    logger.exception("Unhandled error %s on %s %s", error_id, request.method, request.url.path)
+    return ORJSONResponse(
+        {"detail": "Internal server error", "error_id": error_id},
+        status_code=500,
+    )
+
 # Request/Response Models
 class TeamResponse(BaseModel):
     name: str
@@ -45,7 +108,16 @@ class TeamResponse(BaseModel):
     flag_url: str
 
 
-class MatchPredictionRequest(BaseModel):
+# Request models are frozen slotted dataclasses validated through module-level
+# TypeAdapters: validate_json parses the raw body in pydantic-core straight
+# into the dataclass, skipping BaseModel __init__ overhead on every POST.
+# extra="forbid" rejects unknown keys during that same parse instead of
+# silently carrying them through. Response models stay BaseModel for OpenAPI.
+_REQUEST_CONFIG = ConfigDict(extra="forbid")
+
+
+@pydantic_dataclass(frozen=True, slots=True, config=_REQUEST_CONFIG)
+class MatchPredictionRequest:
     home_team: str
     away_team: str
     is_neutral: bool = True
@@ -62,17 +134,130 @@ class MatchPredictionResponse(BaseModel):
     expected_away_goals: float
 
 
-class SimulationRequest(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True, config=_REQUEST_CONFIG)
+class BatchPredictRequest:
+    matches: List[MatchPredictionRequest] = Field(min_length=1, max_length=100)
+
+
+class BatchPredictResponse(BaseModel):
+    # One entry per requested match, in order; null where team data is missing
+    results: List[Optional[MatchPredictionResponse]]
+
+
+@pydantic_dataclass(frozen=True, slots=True, config=_REQUEST_CONFIG)
+class SimulationRequest:
     groups: Dict[str, List[str]]
     format: str = "32_team"  # "32_team" or "48_team"
-    n_sims: int = 100
+    n_sims: int = Field(default=100, ge=1, le=10000)
+    # Wall-clock budget replaces the old hard n_sims=500 cap: the simulation
+    # stops once the budget elapses and reports the sims actually completed,
+    # so fast hardware runs more sims and slow hardware still responds promptly.
+    time_budget_s: float = Field(default=2.0, gt=0, le=10.0)
+
+    def __post_init__(self):
+        """Validate format and group structure before the handler runs."""
+        if self.format not in _VALID_FORMATS:
+            raise ValueError("Format must be '32_team' or '48_team'")
+        expected_groups = _EXPECTED_GROUPS[self.format]
+        if len(self.groups) != expected_groups:
+            raise ValueError(
+                f"Expected {expected_groups} groups for {self.format} format, "
+                f"got {len(self.groups)}"
+            )
+        seen = set()
+        for group_name, teams in self.groups.items():
+            if len(teams) != 4:
+                raise ValueError(
+                    f"Group {group_name} must have exactly 4 teams, got {len(teams)}"
+                )
+            for team in teams:
+                # A team in two groups would leave unfilled bracket slots in
+                # the vectorized knockout stage
+                if team in seen:
+                    raise ValueError(f"Team {team} appears in more than one group")
+                seen.add(team)
 
 
-class SimulationResponse(BaseModel):
-    champions: Dict[str, int]
-    finalists: Dict[str, int]
-    semifinalists: Dict[str, int]
-    n_sims: int
+class _PredictBatcher:
+    """
+    Coalesce concurrent /api/predict calls into one batched model call.
+
+    Requests arriving within max_delay of each other (up to max_batch_size)
+    are run through predictor.predict_matches as a single XGBoost predict,
+    instead of N scalar inferences under concurrent load.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_delay: float = 0.01):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, match: Tuple[str, str, bool, bool]) -> Optional[dict]:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((match, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_delay
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                results = await asyncio.to_thread(
+                    predictor.predict_matches, [match for match, _ in batch]
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+_predict_batcher = _PredictBatcher()
+
+_PREDICT_ADAPTER = TypeAdapter(MatchPredictionRequest)
+_BATCH_PREDICT_ADAPTER = TypeAdapter(BatchPredictRequest)
+_SIM_ADAPTER = TypeAdapter(SimulationRequest)
+
+
+# No legitimate payload comes close to this (a full 48-team bracket is ~2KB);
+# reject oversized bodies from the Content-Length header before reading or
+# parsing a single byte.
+_MAX_BODY_BYTES = 64 * 1024
+
+
+async def _validate_body(request: Request, adapter: TypeAdapter):
+    """Parse and validate a request body directly from raw bytes."""
+    if int(request.headers.get("content-length", "0")) > _MAX_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
 
 
 # Bracket-related models
@@ -100,10 +285,12 @@ class Bracket(BaseModel):
 
 
 class BracketSimulationResponse(BaseModel):
-    # Monte Carlo results
-    champions: Dict[str, int]
-    finalists: Dict[str, int]
-    semifinalists: Dict[str, int]
+    # Monte Carlo results as (team, count) pairs sorted by count descending,
+    # trimmed to the top 16 -- smaller JSON than a full team dict, validated
+    # faster, and presorted for the client
+    champions: List[Tuple[str, int]]
+    finalists: List[Tuple[str, int]]
+    semifinalists: List[Tuple[str, int]]
     n_sims: int
     # Deterministic bracket prediction
     group_results: Dict[str, List[GroupStanding]]
@@ -120,6 +307,30 @@ class PresetResponse(BaseModel):
     metadata: Optional[dict] = None
 
 
+# Constant lookup tables for request validation (O(1) membership, no
+# per-request list allocation)
+_VALID_FORMATS = frozenset({"32_team", "48_team"})
+_EXPECTED_GROUPS = {"32_team": 8, "48_team": 12}
+
+# The cached GET payloads only change on deploy; let browsers/CDNs revalidate
+# with ETags and serve 304s instead of re-downloading.
+_CACHE_CONTROL = "public, max-age=3600"
+
+
+@lru_cache(maxsize=16)
+def _etag_for(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def _cached_json_response(request: Request, payload: bytes) -> Response:
+    """Serve cached JSON bytes with ETag/Cache-Control, honoring If-None-Match."""
+    etag = _etag_for(payload)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
 # API Endpoints
 @app.get("/")
 async def root():
@@ -127,165 +338,414 @@ async def root():
     return {"status": "ok", "message": "World Cup Predictor API"}
 
 
-@app.get("/api/teams", response_model=List[TeamResponse])
-async def get_teams():
+# Serialized /api/teams payload, built once after models load. The team list
+# only changes when the predictor reloads models (startup), so serving cached
+# bytes skips Pydantic validation and JSON encoding on every request.
+_TEAMS_JSON_CACHE: Optional[bytes] = None
+
+
+def _build_teams_cache() -> bytes:
+    """Serialize the teams payload once; called after models load."""
+    teams = predictor.get_teams()
+    flag_urls = get_flag_urls([t['name'] for t in teams])
+    payload = [
+        {
+            "name": t['name'],
+            "iso_code": t['iso_code'],
+            "elo_rating": t['elo_rating'],
+            "flag_url": url,
+        }
+        for t, url in zip(teams, flag_urls)
+    ]
+    return orjson.dumps(payload)
+
+
+@app.get("/api/teams")
+async def get_teams(request: Request):
     """
     Get list of all available teams with metadata.
-    
+
     Returns teams sorted by Elo rating (highest first).
     """
-    try:
-        teams = predictor.get_teams()
-        return [
-            TeamResponse(
-                name=t['name'],
-                iso_code=t['iso_code'],
-                elo_rating=t['elo_rating'],
-                flag_url=get_flag_url(t['name'])
-            )
-            for t in teams
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to load teams: {str(e)}")
+    global _TEAMS_JSON_CACHE
+    if _TEAMS_JSON_CACHE is None:
+        _TEAMS_JSON_CACHE = _build_teams_cache()
+    return _cached_json_response(request, _TEAMS_JSON_CACHE)
 
 
 @app.post("/api/predict", response_model=MatchPredictionResponse)
-async def predict_match(request: MatchPredictionRequest):
+async def predict_match(raw_request: Request):
     """
     Predict the outcome of a single match between two teams.
-    
+
     Returns win/draw/loss probabilities and expected goals.
     """
-    try:
-        result = predictor.predict_match(
-            home_team=request.home_team,
-            away_team=request.away_team,
-            is_neutral=request.is_neutral,
-            is_world_cup=request.is_world_cup
+    request = await _validate_body(raw_request, _PREDICT_ADAPTER)
+    result = await _predict_batcher.predict(
+        (request.home_team, request.away_team, request.is_neutral, request.is_world_cup)
+    )
+
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Missing data for one or both teams: {request.home_team}, {request.away_team}"
         )
-        
-        if result is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Missing data for one or both teams: {request.home_team}, {request.away_team}"
-            )
-        
-        return MatchPredictionResponse(**result)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+
+    return MatchPredictionResponse(**result)
 
 
-@app.post("/api/simulate", response_model=BracketSimulationResponse)
-async def simulate_tournament(request: SimulationRequest):
+@app.post("/api/predict/batch", response_model=BatchPredictResponse)
+async def predict_matches(raw_request: Request):
+    """
+    Predict many matches in one call.
+
+    Amortizes HTTP round-trips, validation, and model dispatch across the
+    whole batch -- a bracket matrix needs one request instead of O(n^2).
+    Entries with missing team data come back as null instead of failing
+    the batch.
+    """
+    request = await _validate_body(raw_request, _BATCH_PREDICT_ADAPTER)
+    results = await asyncio.to_thread(
+        predictor.predict_matches,
+        [(m.home_team, m.away_team, m.is_neutral, m.is_world_cup) for m in request.matches]
+    )
+    return BatchPredictResponse(
+        results=[MatchPredictionResponse(**r) if r is not None else None for r in results]
+    )
+
+
+# Users iterating on a bracket often resubmit identical groups; cache recent
+# simulation responses keyed by a canonical hash of the request. Results are
+# stochastic, so a cache hit replays the earlier run -- acceptable for an
+# exploration tool in exchange for microsecond repeats of the heaviest call.
+# Entries expire after an hour so a long-lived process eventually refreshes
+# stale runs instead of replaying them forever.
+_SIM_CACHE: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+_SIM_CACHE_MAX = 256
+_SIM_CACHE_TTL = 3600.0  # seconds
+
+# Only the head of each histogram is meaningful to the client (the frontend
+# renders at most 15 champions); trim the long tail of one-off appearances.
+_SIM_TOP_K = 16
+
+
+def _sim_cache_get(key: bytes) -> Optional[dict]:
+    """Return a cached simulation response, evicting it if expired."""
+    entry = _SIM_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if time.monotonic() >= expires_at:
+        del _SIM_CACHE[key]
+        return None
+    _SIM_CACHE.move_to_end(key)
+    return payload
+
+
+def _sim_cache_put(key: bytes, payload: dict) -> None:
+    _SIM_CACHE[key] = (time.monotonic() + _SIM_CACHE_TTL, payload)
+    if len(_SIM_CACHE) > _SIM_CACHE_MAX:
+        _SIM_CACHE.popitem(last=False)
+
+# Dedicated pool for simulation work so long-running Monte Carlo jobs don't
+# starve the default to_thread pool that other blocking calls share. Threads
+# (not processes) because the predictor is an in-process singleton and its
+# NumPy/XGBoost hot loops release the GIL.
+_SIM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="sim"
+)
+
+
+def _simulation_cache_key(request: SimulationRequest) -> bytes:
+    canonical = {
+        "format": request.format,
+        "n_sims": request.n_sims,
+        "time_budget_s": request.time_budget_s,
+        "groups": {g: sorted(t) for g, t in sorted(request.groups.items())},
+    }
+    return hashlib.blake2b(orjson.dumps(canonical), digest_size=16).digest()
+
+
+@app.post("/api/simulate", responses={200: {"model": BracketSimulationResponse}})
+async def simulate_tournament(raw_request: Request):
     """
     Run a full tournament simulation with custom groups.
-    
+
     This performs:
     1. Monte Carlo simulation for championship probabilities
     2. Deterministic bracket prediction showing most likely outcomes
     """
-    try:
-        # Validate format
-        if request.format not in ["32_team", "48_team"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Format must be '32_team' or '48_team'"
-            )
-        
-        # Validate group count
-        expected_groups = 8 if request.format == "32_team" else 12
-        if len(request.groups) != expected_groups:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Expected {expected_groups} groups for {request.format} format, got {len(request.groups)}"
-            )
-        
-        # Validate teams per group
-        for group_name, teams in request.groups.items():
-            if len(teams) != 4:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Group {group_name} must have exactly 4 teams, got {len(teams)}"
-                )
-        
-        # Run Monte Carlo simulation for probabilities
-        mc_result = predictor.simulate_tournament(
+    request = await _validate_body(raw_request, _SIM_ADAPTER)
+    cache_key = _simulation_cache_key(request)
+    cached = _sim_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    # Format and group structure are validated by SimulationRequest itself
+    # (invalid bodies 422 before this handler runs).
+
+    # The Monte Carlo and deterministic simulations are independent
+    # CPU-bound calls, so run them on the simulation pool concurrently:
+    # wall time is max(t_mc, t_det) instead of the sum, and the event loop
+    # stays free to serve other requests meanwhile.
+    loop = asyncio.get_running_loop()
+    mc_result, bracket_result = await asyncio.gather(
+        loop.run_in_executor(_SIM_EXECUTOR, partial(
+            predictor.simulate_tournament,
             groups=request.groups,
             tournament_format=request.format,
-            n_tournament_sims=min(request.n_sims, 500)  # Cap at 500 for performance
-        )
-        
-        # Run deterministic simulation for bracket prediction
-        bracket_result = predictor.simulate_deterministic_tournament(
+            n_tournament_sims=request.n_sims,
+            time_budget_s=request.time_budget_s
+        )),
+        loop.run_in_executor(_SIM_EXECUTOR, partial(
+            predictor.simulate_deterministic_tournament,
             groups=request.groups,
             tournament_format=request.format
-        )
-        
-        # Combine results
-        return BracketSimulationResponse(
-            champions=mc_result['champions'],
-            finalists=mc_result['finalists'],
-            semifinalists=mc_result['semifinalists'],
-            n_sims=mc_result['n_sims'],
-            group_results=bracket_result['group_results'],
-            bracket=bracket_result['bracket']
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+        )),
+    )
+
+    # Combine results as a plain dict; the predictor's output is already the
+    # documented shape (BracketSimulationResponse in the OpenAPI schema), so
+    # skip the second Pydantic validation walk over the whole tree and let
+    # ORJSONResponse serialize directly. Long-tail teams with a handful of
+    # appearances are noise to the client, so only the top entries ship.
+    response = {
+        "champions": Counter(mc_result['champions']).most_common(_SIM_TOP_K),
+        "finalists": Counter(mc_result['finalists']).most_common(_SIM_TOP_K),
+        "semifinalists": Counter(mc_result['semifinalists']).most_common(_SIM_TOP_K),
+        "n_sims": mc_result['n_sims'],
+        "group_results": bracket_result['group_results'],
+        "bracket": bracket_result['bracket'],
+    }
+
+    _sim_cache_put(cache_key, response)
+    return response
 
 
-@app.get("/api/presets/{preset_name}", response_model=PresetResponse)
-async def get_preset(preset_name: str):
+# How many tournament sims to run between progress events on the stream
+_SIM_STREAM_CHUNK = 25
+
+
+@app.post("/api/simulate/stream")
+async def simulate_tournament_stream(raw_request: Request):
+    """
+    Run a tournament simulation, streaming progress as Server-Sent Events.
+
+    Emits a 'progress' event with running champion/finalist/semifinalist
+    tallies every few simulations so the client can render early (and
+    cancel mid-run), then a final 'complete' event with the same payload
+    shape as POST /api/simulate.
+    """
+    request = await _validate_body(raw_request, _SIM_ADAPTER)
+    loop = asyncio.get_running_loop()
+
+    async def event_stream():
+        champions: Counter = Counter()
+        finalists: Counter = Counter()
+        semifinalists: Counter = Counter()
+        sims_done = 0
+
+        # Kick off the deterministic bracket alongside the first MC chunk
+        bracket_future = loop.run_in_executor(_SIM_EXECUTOR, partial(
+            predictor.simulate_deterministic_tournament,
+            groups=request.groups,
+            tournament_format=request.format
+        ))
+
+        deadline = time.monotonic() + request.time_budget_s
+        while sims_done < request.n_sims:
+            if sims_done and time.monotonic() >= deadline:
+                break
+            chunk = min(_SIM_STREAM_CHUNK, request.n_sims - sims_done)
+            mc_result = await loop.run_in_executor(_SIM_EXECUTOR, partial(
+                predictor.simulate_tournament,
+                groups=request.groups,
+                tournament_format=request.format,
+                n_tournament_sims=chunk
+            ))
+            champions.update(mc_result['champions'])
+            finalists.update(mc_result['finalists'])
+            semifinalists.update(mc_result['semifinalists'])
+            sims_done += chunk
+
+            payload = orjson.dumps({
+                "champions": champions.most_common(_SIM_TOP_K),
+                "finalists": finalists.most_common(_SIM_TOP_K),
+                "semifinalists": semifinalists.most_common(_SIM_TOP_K),
+                "n_sims": sims_done,
+            }).decode()
+            yield f"event: progress\ndata: {payload}\n\n"
+
+        bracket_result = await bracket_future
+        payload = orjson.dumps({
+            "champions": champions.most_common(_SIM_TOP_K),
+            "finalists": finalists.most_common(_SIM_TOP_K),
+            "semifinalists": semifinalists.most_common(_SIM_TOP_K),
+            "n_sims": sims_done,
+            "group_results": bracket_result['group_results'],
+            "bracket": bracket_result['bracket'],
+        }).decode()
+        yield f"event: complete\ndata: {payload}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+_VALID_PRESETS = frozenset({"wc2022", "wc2026"})
+
+
+@lru_cache(maxsize=4)
+def _load_preset_cached(preset_name: str) -> bytes:
+    """Load and serialize a preset once; presets are immutable once deployed."""
+    result = predictor.load_preset(preset_name)
+    return orjson.dumps(result) if result else b""
+
+
+@app.get("/api/presets/{preset_name}")
+async def get_preset(preset_name: str, request: Request):
     """
     Get a preset tournament configuration with pre-computed results.
-    
+
     Available presets:
     - wc2022: 2022 FIFA World Cup (32 teams, 8 groups)
     - wc2026: 2026 FIFA World Cup projected (48 teams, 12 groups)
     """
-    valid_presets = ["wc2022", "wc2026"]
-    if preset_name not in valid_presets:
+    if preset_name not in _VALID_PRESETS:
         raise HTTPException(
             status_code=404,
-            detail=f"Preset '{preset_name}' not found. Available presets: {valid_presets}"
+            detail=f"Preset '{preset_name}' not found. Available presets: {sorted(_VALID_PRESETS)}"
         )
-    
-    try:
-        result = predictor.load_preset(preset_name)
-        
-        if result is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Preset '{preset_name}' data files not found"
-            )
-        
-        return PresetResponse(**result)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to load preset: {str(e)}")
+
+    cached = _load_preset_cached(preset_name)
+
+    if not cached:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Preset '{preset_name}' data files not found"
+        )
+
+    return _cached_json_response(request, cached)
 
 
 @app.get("/api/presets")
-async def list_presets():
+async def list_presets(request: Request):
     """List all available presets."""
-    return {
-        "presets": [
-            {"id": "wc2022", "name": "2022 FIFA World Cup", "format": "32_team"},
-            {"id": "wc2026", "name": "2026 FIFA World Cup (Projected)", "format": "48_team"},
-        ]
+    return _cached_json_response(request, _PRESETS_JSON)
+
+
+# Everything in /api/model-info except top_features and teams_available is
+# static, so the payload is built once (at startup, when those two values are
+# known) and served as cached bytes.
+_MODEL_INFO_JSON: Optional[bytes] = None
+
+_PRESETS_JSON: bytes = orjson.dumps({
+    "presets": [
+        {"id": "wc2022", "name": "2022 FIFA World Cup", "format": "32_team"},
+        {"id": "wc2026", "name": "2026 FIFA World Cup (Projected)", "format": "48_team"},
+    ]
+})
+
+
+def _build_model_info_json() -> bytes:
+    """Serialize the model-info payload once; called after models load."""
+    num_teams = len(predictor.get_teams())
+
+    top_features = []
+    if hasattr(predictor, 'feature_columns') and predictor.feature_columns:
+        top_features = predictor.feature_columns[:10]
+
+    return orjson.dumps({
+        **_MODEL_INFO_TEMPLATE,
+        "features": {**_MODEL_INFO_TEMPLATE["features"], "top_features": top_features},
+        "coverage": {**_MODEL_INFO_TEMPLATE["coverage"], "teams_available": num_teams},
+    })
+
+
+_MODEL_INFO_TEMPLATE = {
+    "data_sources": {
+        "matches": {
+            "name": "International Match Results",
+            "description": "Historical international football matches from 2010 to present",
+            "records": "14,000+",
+            "date_range": "2010 - 2024",
+            "features": ["Goals scored", "Tournament type", "Venue", "Match date"]
+        },
+        "players": {
+            "name": "EA Sports FC Player Ratings",
+            "description": "Comprehensive player statistics from EA Sports FC (FIFA 15-24)",
+            "records": "100,000+",
+            "date_range": "FIFA 15 - FIFA 24",
+            "features": ["Overall rating", "Pace", "Shooting", "Passing", "Dribbling", "Defending", "Physic"]
+        },
+        "rankings": {
+            "name": "FIFA World Rankings",
+            "description": "Official FIFA country rankings for additional context",
+            "records": "200+",
+            "features": ["Rank", "Points", "Confederation"]
+        }
+    },
+    "model": {
+        "type": "Dual XGBoost Regression",
+        "description": "Two separate gradient boosting models predict expected goals for home and away teams",
+        "hyperparameters": {
+            "n_estimators": 2000,
+            "learning_rate": 0.01,
+            "max_depth": 4,
+            "subsample": 0.7,
+            "colsample_bytree": 0.7,
+            "early_stopping_rounds": 50
+        },
+        "training_split": "Pre-2022 matches for training, 2022+ for validation"
+    },
+    "simulation": {
+        "method": "Skellam closed-form with vectorized Monte Carlo",
+        "description": "Predicted goals become Poisson rates whose difference follows a Skellam distribution, giving exact win/draw/loss probabilities per match; tournaments are then simulated in vectorized batches",
+        "n_tournament_sims": "up to 10,000 per request, within a wall-clock time budget"
+    },
+    "features": {
+        "count": 30,
+        "categories": {
+            "elo_ratings": {
+                "description": "Dynamic team strength calculated from 14 years of match history",
+                "features": ["home_elo", "away_elo", "elo_diff"]
+            },
+            "player_quality": {
+                "description": "Aggregated ratings from top 14 squad members",
+                "features": ["avg_overall", "max_overall", "avg_attack", "avg_defense", "avg_pace", "avg_shooting", "avg_passing"]
+            },
+            "recent_form": {
+                "description": "Rolling 5-match statistics",
+                "features": ["form_scored", "form_conceded", "form_win_rate"]
+            },
+            "match_context": {
+                "description": "Tournament and venue information",
+                "features": ["is_neutral", "is_world_cup", "is_continental"]
+            }
+        },
+        "top_features": []
+    },
+    "performance": {
+        "goals_rmse": "~1.3",
+        "goals_mae": "~1.0",
+        "outcome_accuracy": "~55%",
+        "validation": "2022 World Cup matches"
+    },
+    "coverage": {
+        "teams_available": 0,
+        "countries_with_data": "150+"
+    },
+    "tech_stack": {
+        "ml": ["XGBoost 2.0", "scikit-learn", "CuPy (GPU)", "SciPy"],
+        "backend": ["Python 3.11", "FastAPI", "Pandas", "NumPy"],
+        "frontend": ["React 18", "TypeScript", "Vite", "dnd-kit"],
+        "deployment": ["Railway", "Docker"]
     }
+}
 
 
 @app.get("/api/model-info")
-async def get_model_info():
+async def get_model_info(request: Request):
     """
     Get information about the ML model, data sources, and methodology.
-    
+
     Returns details about:
     - Data sources and coverage
     - Model architecture and hyperparameters
@@ -293,110 +753,45 @@ async def get_model_info():
     - Performance metrics
     - Tech stack
     """
-    try:
-        predictor.load_models()
-        
-        # Get team count for coverage stats
-        teams = predictor.get_teams()
-        num_teams = len(teams)
-        
-        # Get top features from model (if available)
-        top_features = []
-        if hasattr(predictor, 'feature_columns') and predictor.feature_columns:
-            top_features = predictor.feature_columns[:10]
-        
-        return {
-            "data_sources": {
-                "matches": {
-                    "name": "International Match Results",
-                    "description": "Historical international football matches from 2010 to present",
-                    "records": "14,000+",
-                    "date_range": "2010 - 2024",
-                    "features": ["Goals scored", "Tournament type", "Venue", "Match date"]
-                },
-                "players": {
-                    "name": "EA Sports FC Player Ratings",
-                    "description": "Comprehensive player statistics from EA Sports FC (FIFA 15-24)",
-                    "records": "100,000+",
-                    "date_range": "FIFA 15 - FIFA 24",
-                    "features": ["Overall rating", "Pace", "Shooting", "Passing", "Dribbling", "Defending", "Physic"]
-                },
-                "rankings": {
-                    "name": "FIFA World Rankings",
-                    "description": "Official FIFA country rankings for additional context",
-                    "records": "200+",
-                    "features": ["Rank", "Points", "Confederation"]
-                }
-            },
-            "model": {
-                "type": "Dual XGBoost Regression",
-                "description": "Two separate gradient boosting models predict expected goals for home and away teams",
-                "hyperparameters": {
-                    "n_estimators": 2000,
-                    "learning_rate": 0.01,
-                    "max_depth": 4,
-                    "subsample": 0.7,
-                    "colsample_bytree": 0.7,
-                    "early_stopping_rounds": 50
-                },
-                "training_split": "Pre-2022 matches for training, 2022+ for validation"
-            },
-            "simulation": {
-                "method": "Poisson-based Monte Carlo",
-                "description": "Predicted goals become lambda parameter for Poisson distribution, then simulated 10,000+ times",
-                "n_sims_per_match": 10000,
-                "n_tournament_sims": "100-500 per request"
-            },
-            "features": {
-                "count": 30,
-                "categories": {
-                    "elo_ratings": {
-                        "description": "Dynamic team strength calculated from 14 years of match history",
-                        "features": ["home_elo", "away_elo", "elo_diff"]
-                    },
-                    "player_quality": {
-                        "description": "Aggregated ratings from top 14 squad members",
-                        "features": ["avg_overall", "max_overall", "avg_attack", "avg_defense", "avg_pace", "avg_shooting", "avg_passing"]
-                    },
-                    "recent_form": {
-                        "description": "Rolling 5-match statistics",
-                        "features": ["form_scored", "form_conceded", "form_win_rate"]
-                    },
-                    "match_context": {
-                        "description": "Tournament and venue information",
-                        "features": ["is_neutral", "is_world_cup", "is_continental"]
-                    }
-                },
-                "top_features": top_features
-            },
-            "performance": {
-                "goals_rmse": "~1.3",
-                "goals_mae": "~1.0",
-                "outcome_accuracy": "~55%",
-                "validation": "2022 World Cup matches"
-            },
-            "coverage": {
-                "teams_available": num_teams,
-                "countries_with_data": "150+"
-            },
-            "tech_stack": {
-                "ml": ["XGBoost 2.0", "scikit-learn", "CuPy (GPU)", "SciPy"],
-                "backend": ["Python 3.11", "FastAPI", "Pandas", "NumPy"],
-                "frontend": ["React 18", "TypeScript", "Vite", "dnd-kit"],
-                "deployment": ["Railway", "Docker"]
-            }
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get model info: {str(e)}")
+    global _MODEL_INFO_JSON
+    if _MODEL_INFO_JSON is None:
+        # _build_model_info_json loads models itself via get_teams()
+        _MODEL_INFO_JSON = _build_model_info_json()
+    return _cached_json_response(request, _MODEL_INFO_JSON)
 
 
-# Startup event to preload models
-@app.on_event("startup")
-async def startup_event():
-    """Load models on startup for faster first request."""
-    try:
-        predictor.load_models()
-        print("Models loaded successfully on startup")
-    except Exception as e:
-        print(f"Warning: Could not preload models: {e}")
-        print("Models will be loaded on first request")
+def _warm_prediction():
+    """
+    Run a dummy prediction and a full deterministic tournament so the first
+    real request doesn't pay lazy-import and first-call dispatch costs
+    (Pandas feature frame, XGBoost predict, SciPy Poisson sampling) or
+    cold code paths in the bracket logic.
+    """
+    teams = predictor.get_teams()
+    if len(teams) >= 2:
+        predictor.predict_match(teams[0]['name'], teams[1]['name'])
+        predictor.get_knockout_win_probability(teams[0]['name'], teams[1]['name'])
+    if len(teams) >= 32:
+        # Canned 32-team bracket from the top-rated teams exercises the
+        # group-stage and knockout code end to end.
+        names = [t['name'] for t in teams[:32]]
+        groups = {
+            group: names[i * 4:(i + 1) * 4]
+            for i, group in enumerate("ABCDEFGH")
+        }
+        predictor.simulate_deterministic_tournament(groups, "32_team")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Local/dev entry point mirroring the deploy command (Procfile /
+    # railway.toml): uvloop + httptools, workers from WEB_CONCURRENCY.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
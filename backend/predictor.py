@@ -7,14 +7,18 @@ and tournament simulation functions.
 
 import json
 import os
+import sys
+import time
 from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
 import pandas as pd
-from scipy.stats import poisson
+import xgboost as xgb
+from scipy.stats import skellam
 
 from iso_codes import get_iso_code, get_flag_url
 
@@ -23,6 +27,18 @@ BASE_DIR = Path(__file__).parent
 MODEL_PATH = BASE_DIR / "model_artifacts"
 SIMULATIONS_PATH = BASE_DIR / "simulations"
 
+# Pre-parsed copy of the JSON/CSV artifacts below, rebuilt whenever any of
+# the source files change. One joblib read replaces four json.load calls
+# plus a pandas CSV parse on every cold start.
+ARTIFACT_BUNDLE_PATH = MODEL_PATH / "artifact_bundle.joblib"
+_ARTIFACT_SOURCES = (
+    "elo_ratings.json",
+    "player_aggregates.csv",
+    "recent_form.json",
+    "feature_columns.json",
+    "teams_metadata.json",
+)
+
 
 class WorldCupPredictor:
     """Handles model loading and match/tournament predictions."""
@@ -30,48 +46,168 @@ class WorldCupPredictor:
     def __init__(self):
         self.model_home = None
         self.model_away = None
+        self._booster_home = None
+        self._booster_away = None
+        self._iter_home = (0, 0)
+        self._iter_away = (0, 0)
         self.elo_ratings = {}
         self.player_aggregates = None
+        self._player_stats_v24 = {}
         self.recent_form = {}
         self.feature_columns = []
+        self._col_idx = {}
+        self._match_slot_idx = []
         self.teams_metadata = []
         self._loaded = False
+        # team -> (home-side fragment, away-side fragment, elo, avg_overall,
+        # avg_attack, avg_defense), or None where player data is missing.
+        # Everything here depends on one team only, so it's computed once per
+        # team instead of re-filtering the player DataFrame per match.
+        self._team_feature_cache: Dict[str, Optional[tuple]] = {}
+        # PCG64 generator shared by all simulation paths; the C-level
+        # Generator API is considerably faster than the legacy np.random.*
+        # module functions.
+        self._rng = np.random.default_rng()
+        # Memoized per-pair match predictions (both orientations); filled by
+        # _tournament_match_probs. O(n_teams^2) small dicts at worst.
+        self._pair_prob_cache: Dict[Tuple[str, str], Optional[dict]] = {}
     
     def load_models(self):
         """Load all model artifacts."""
         if self._loaded:
             return
         
-        # Load XGBoost models
-        self.model_home = joblib.load(MODEL_PATH / "model_home_goals.joblib")
-        self.model_away = joblib.load(MODEL_PATH / "model_away_goals.joblib")
-        
-        # Load Elo ratings
-        with open(MODEL_PATH / "elo_ratings.json", "r") as f:
-            self.elo_ratings = json.load(f)
-        
-        # Load player aggregates
-        self.player_aggregates = pd.read_csv(MODEL_PATH / "player_aggregates.csv")
-        
-        # Load recent form
-        with open(MODEL_PATH / "recent_form.json", "r") as f:
-            self.recent_form = json.load(f)
-        
-        # Load feature columns
-        with open(MODEL_PATH / "feature_columns.json", "r") as f:
-            self.feature_columns = json.load(f)
-        
-        # Load or generate teams metadata
-        teams_metadata_path = MODEL_PATH / "teams_metadata.json"
-        if teams_metadata_path.exists():
-            with open(teams_metadata_path, "r") as f:
-                self.teams_metadata = json.load(f)
+        # Load XGBoost models. Hot paths predict through raw Boosters:
+        # inplace_predict skips the sklearn wrapper and per-call DMatrix
+        # construction (~10x less overhead on small batches). Native UBJ
+        # Booster files load without unpickling the wrapper at all; they are
+        # exported from the joblib models on first boot.
+        ubj_home = MODEL_PATH / "model_home_goals.ubj"
+        ubj_away = MODEL_PATH / "model_away_goals.ubj"
+        if ubj_home.exists() and ubj_away.exists():
+            self._booster_home = xgb.Booster()
+            self._booster_home.load_model(str(ubj_home))
+            self._booster_away = xgb.Booster()
+            self._booster_away.load_model(str(ubj_away))
         else:
-            self.teams_metadata = self._generate_teams_metadata()
-        
+            self.model_home = joblib.load(MODEL_PATH / "model_home_goals.joblib")
+            self.model_away = joblib.load(MODEL_PATH / "model_away_goals.joblib")
+            self._booster_home = self.model_home.get_booster()
+            self._booster_away = self.model_away.get_booster()
+            try:
+                self._booster_home.save_model(str(ubj_home))
+                self._booster_away.save_model(str(ubj_away))
+            except OSError:
+                # Read-only deployment filesystem: keep the joblib path
+                pass
+
+        # The iteration range pins the early-stopped tree count the sklearn
+        # wrapper would have used (preserved through the UBJ round trip).
+        self._iter_home = self._booster_iteration_range(self._booster_home)
+        self._iter_away = self._booster_iteration_range(self._booster_away)
+        
+        # Load the remaining artifacts -- from the pre-parsed bundle when it
+        # is current, otherwise from the JSON/CSV sources (rebuilding the
+        # bundle for the next boot).
+        bundle = self._load_artifact_bundle()
+        if bundle is not None:
+            self.elo_ratings = bundle['elo_ratings']
+            self._player_stats_v24 = bundle['player_stats_v24']
+            self.recent_form = bundle['recent_form']
+            self.feature_columns = bundle['feature_columns']
+            self.teams_metadata = bundle['teams_metadata']
+        else:
+            # Load Elo ratings
+            with open(MODEL_PATH / "elo_ratings.json", "r") as f:
+                self.elo_ratings = json.load(f)
+
+            # Load player aggregates. Feature building only ever needs the
+            # FIFA 24 rows, keyed by country -- index them into a dict once so
+            # lookups are O(1) instead of a boolean mask over the whole
+            # DataFrame per call.
+            self.player_aggregates = pd.read_csv(MODEL_PATH / "player_aggregates.csv")
+            df24 = self.player_aggregates[self.player_aggregates['fifa_version'] == 24]
+            self._player_stats_v24 = {
+                row['country']: row for _, row in df24.iterrows()
+            }
+
+            # Load recent form
+            with open(MODEL_PATH / "recent_form.json", "r") as f:
+                self.recent_form = json.load(f)
+
+            # Load feature columns
+            with open(MODEL_PATH / "feature_columns.json", "r") as f:
+                self.feature_columns = json.load(f)
+
+            # Load or generate teams metadata
+            teams_metadata_path = MODEL_PATH / "teams_metadata.json"
+            if teams_metadata_path.exists():
+                with open(teams_metadata_path, "r") as f:
+                    self.teams_metadata = json.load(f)
+                # Sort once at load so get_teams() never re-sorts per request
+                self.teams_metadata.sort(key=itemgetter('elo_rating'), reverse=True)
+            else:
+                self.teams_metadata = self._generate_teams_metadata()
+
+            self._write_artifact_bundle()
+
+        # Index map so feature vectors assemble by integer slot instead of
+        # per-call string lookups
+        self._col_idx = {name: i for i, name in enumerate(self.feature_columns)}
+        self._match_slot_idx = [
+            self._col_idx[name] for name in (
+                'elo_diff', 'overall_diff', 'attack_diff', 'defense_diff',
+                'is_neutral', 'is_world_cup', 'is_continental',
+            )
+        ]
+
         self._loaded = True
         print(f"Loaded models. {len(self.teams_metadata)} teams available.")
     
+    @staticmethod
+    def _artifact_source_mtimes() -> Dict[str, float]:
+        """Modification times of the bundle's source files (missing files are omitted)."""
+        return {
+            name: os.path.getmtime(MODEL_PATH / name)
+            for name in _ARTIFACT_SOURCES
+            if (MODEL_PATH / name).exists()
+        }
+
+    def _load_artifact_bundle(self) -> Optional[dict]:
+        """Load the pre-parsed artifact bundle, or None if absent or stale."""
+        if not ARTIFACT_BUNDLE_PATH.exists():
+            return None
+        try:
+            bundle = joblib.load(ARTIFACT_BUNDLE_PATH)
+        except Exception:
+            return None
+        if bundle.get('source_mtimes') != self._artifact_source_mtimes():
+            return None
+        return bundle
+
+    def _write_artifact_bundle(self):
+        """Persist the parsed artifacts so the next boot skips JSON/CSV parsing."""
+        bundle = {
+            'source_mtimes': self._artifact_source_mtimes(),
+            'elo_ratings': self.elo_ratings,
+            'player_stats_v24': self._player_stats_v24,
+            'recent_form': self.recent_form,
+            'feature_columns': self.feature_columns,
+            'teams_metadata': self.teams_metadata,
+        }
+        try:
+            joblib.dump(bundle, ARTIFACT_BUNDLE_PATH, compress=3)
+        except OSError:
+            # Read-only deployment filesystem: the parse-on-boot path above
+            # still works, just without the warm-start shortcut.
+            pass
+
+    @staticmethod
+    def _booster_iteration_range(booster) -> Tuple[int, int]:
+        """Iteration range honoring early stopping ((0, 0) means all trees)."""
+        best = getattr(booster, "best_iteration", None)
+        return (0, best + 1) if best is not None else (0, 0)
+
     def _generate_teams_metadata(self) -> List[dict]:
         """Generate teams metadata dynamically from loaded data."""
         player_countries = set(
@@ -81,6 +217,9 @@ class WorldCupPredictor:
         
         teams_data = []
         for team in available_teams:
+            # Interned names share the str object (and its cached hash) with
+            # the ISO_CODES keys across requests.
+            team = sys.intern(team)
             teams_data.append({
                 'name': team,
                 'iso_code': get_iso_code(team),
@@ -88,7 +227,7 @@ class WorldCupPredictor:
                 'flag_url': get_flag_url(team)
             })
         
-        teams_data.sort(key=lambda x: x['elo_rating'], reverse=True)
+        teams_data.sort(key=itemgetter('elo_rating'), reverse=True)
         return teams_data
     
     def get_teams(self) -> List[dict]:
@@ -98,97 +237,129 @@ class WorldCupPredictor:
     
     def get_player_stats(self, country: str) -> Optional[pd.Series]:
         """Get player aggregate stats for a country (FIFA 24)."""
-        country_data = self.player_aggregates[
-            (self.player_aggregates['country'] == country) &
-            (self.player_aggregates['fifa_version'] == 24)
-        ]
-        if len(country_data) == 0:
-            return None
-        return country_data.iloc[0]
+        return self._player_stats_v24.get(country)
     
-    def predict_match(
+    def _team_features(self, team: str) -> Optional[tuple]:
+        """
+        Get (or lazily build) the cached single-team feature fragments.
+
+        Returns (home_vec, away_vec, elo, avg_overall, avg_attack,
+        avg_defense) -- the home/away slot-vector halves of a feature row
+        plus the scalars the cross-team diff features need -- or None if the
+        team has no player data.
+        """
+        if team in self._team_feature_cache:
+            return self._team_feature_cache[team]
+
+        players = self.get_player_stats(team)
+        if players is None:
+            self._team_feature_cache[team] = None
+            return None
+
+        elo = self.elo_ratings.get(team, 1500)
+        form = self.recent_form.get(team, {'avg_scored': 1.5, 'avg_conceded': 1.5, 'win_rate': 0.33})
+
+        avg_overall = float(players['avg_overall'])
+        avg_attack = float(players['avg_attack_overall'])
+        avg_defense = float(players['avg_defense_overall'])
+
+        home_fragment = {
+            'home_elo': elo,
+            'home_avg_overall': avg_overall,
+            'home_max_overall': float(players['max_overall']),
+            'home_avg_attack': avg_attack,
+            'home_avg_defense': avg_defense,
+            'home_avg_pace': float(players['avg_pace']),
+            'home_avg_shooting': float(players['avg_shooting']),
+            'home_avg_passing': float(players['avg_passing']),
+            'home_form_scored': form['avg_scored'],
+            'home_form_conceded': form['avg_conceded'],
+            'home_form_win_rate': form['win_rate'],
+        }
+        away_fragment = {
+            'away_elo': elo,
+            'away_avg_overall': avg_overall,
+            'away_max_overall': home_fragment['home_max_overall'],
+            'away_avg_attack': avg_attack,
+            'away_avg_defense': avg_defense,
+            'away_avg_pace': home_fragment['home_avg_pace'],
+            'away_avg_shooting': home_fragment['home_avg_shooting'],
+            'away_avg_passing': home_fragment['home_avg_passing'],
+            'away_form_scored': form['avg_scored'],
+            'away_form_conceded': form['avg_conceded'],
+            'away_form_win_rate': form['win_rate'],
+        }
+
+        # Store the halves as slot vectors in training column order: a full
+        # row is then home_vec + away_vec (disjoint slots) plus the handful
+        # of match-specific entries.
+        idx = self._col_idx
+        home_vec = np.zeros(len(self.feature_columns), dtype=np.float32)
+        away_vec = np.zeros(len(self.feature_columns), dtype=np.float32)
+        for name, value in home_fragment.items():
+            home_vec[idx[name]] = value
+        for name, value in away_fragment.items():
+            away_vec[idx[name]] = value
+
+        cached = (home_vec, away_vec, elo, avg_overall, avg_attack, avg_defense)
+        self._team_feature_cache[team] = cached
+        return cached
+
+    def _feature_vector(
         self,
         home_team: str,
         away_team: str,
-        is_neutral: bool = True,
-        is_world_cup: bool = True,
-        n_sims: int = 10000
-    ) -> Optional[dict]:
+        is_neutral: bool,
+        is_world_cup: bool
+    ) -> Optional[np.ndarray]:
         """
-        Predict a match between two teams with full probability distribution.
-        
-        Returns dict with:
-        - home_win_prob, draw_prob, away_win_prob
-        - expected_home_goals, expected_away_goals
+        Build one float32 feature row in training column order, or None if
+        player data is missing for either team.
         """
-        self.load_models()
-        
-        # Get player data
-        home_players = self.get_player_stats(home_team)
-        away_players = self.get_player_stats(away_team)
-        
-        if home_players is None or away_players is None:
+        home = self._team_features(home_team)
+        away = self._team_features(away_team)
+
+        if home is None or away is None:
             return None
-        
-        # Get Elo ratings
-        home_elo = self.elo_ratings.get(home_team, 1500)
-        away_elo = self.elo_ratings.get(away_team, 1500)
-        
-        # Get form data
-        home_form = self.recent_form.get(home_team, {'avg_scored': 1.5, 'avg_conceded': 1.5, 'win_rate': 0.33})
-        away_form = self.recent_form.get(away_team, {'avg_scored': 1.5, 'avg_conceded': 1.5, 'win_rate': 0.33})
-        
-        # Build feature vector
-        features = pd.DataFrame([{
-            'home_elo': home_elo,
-            'away_elo': away_elo,
-            'elo_diff': home_elo - away_elo,
-            'home_avg_overall': home_players['avg_overall'],
-            'home_max_overall': home_players['max_overall'],
-            'home_avg_attack': home_players['avg_attack_overall'],
-            'home_avg_defense': home_players['avg_defense_overall'],
-            'home_avg_pace': home_players['avg_pace'],
-            'home_avg_shooting': home_players['avg_shooting'],
-            'home_avg_passing': home_players['avg_passing'],
-            'away_avg_overall': away_players['avg_overall'],
-            'away_max_overall': away_players['max_overall'],
-            'away_avg_attack': away_players['avg_attack_overall'],
-            'away_avg_defense': away_players['avg_defense_overall'],
-            'away_avg_pace': away_players['avg_pace'],
-            'away_avg_shooting': away_players['avg_shooting'],
-            'away_avg_passing': away_players['avg_passing'],
-            'overall_diff': home_players['avg_overall'] - away_players['avg_overall'],
-            'attack_diff': home_players['avg_attack_overall'] - away_players['avg_attack_overall'],
-            'defense_diff': home_players['avg_defense_overall'] - away_players['avg_defense_overall'],
-            'home_form_scored': home_form['avg_scored'],
-            'home_form_conceded': home_form['avg_conceded'],
-            'home_form_win_rate': home_form['win_rate'],
-            'away_form_scored': away_form['avg_scored'],
-            'away_form_conceded': away_form['avg_conceded'],
-            'away_form_win_rate': away_form['win_rate'],
-            'is_neutral': 1 if is_neutral else 0,
-            'is_world_cup': 1 if is_world_cup else 0,
-            'is_continental': 0,
-        }])
-        
-        # Reorder columns to match training
-        features = features[self.feature_columns]
-        
-        # Predict goals
-        home_goals_pred = float(self.model_home.predict(features)[0])
-        away_goals_pred = float(self.model_away.predict(features)[0])
-        
-        # Simulate match using Poisson distribution
+
+        home_vec, _, home_elo, home_overall, home_attack, home_defense = home
+        _, away_vec, away_elo, away_overall, away_attack, away_defense = away
+
+        # The cached halves occupy disjoint slots; summing merges them, then
+        # the match-specific entries are written by precomputed index
+        vec = home_vec + away_vec
+        elo_i, overall_i, attack_i, defense_i, neutral_i, wc_i, cont_i = self._match_slot_idx
+        vec[elo_i] = home_elo - away_elo
+        vec[overall_i] = home_overall - away_overall
+        vec[attack_i] = home_attack - away_attack
+        vec[defense_i] = home_defense - away_defense
+        vec[neutral_i] = 1.0 if is_neutral else 0.0
+        vec[wc_i] = 1.0 if is_world_cup else 0.0
+        vec[cont_i] = 0.0
+        return vec
+
+    @staticmethod
+    def _match_outcome(
+        home_team: str,
+        away_team: str,
+        home_goals_pred: float,
+        away_goals_pred: float
+    ) -> dict:
+        """
+        Turn predicted goals into outcome probabilities.
+
+        The goal difference of two independent Poissons is Skellam
+        distributed, so the win/draw/loss split has a closed form -- exact
+        probabilities with no sampling, where this used to draw 2x10000
+        Poisson variates per match.
+        """
         home_lambda = max(0.1, home_goals_pred)
         away_lambda = max(0.1, away_goals_pred)
-        
-        home_goals = poisson.rvs(mu=home_lambda, size=n_sims)
-        away_goals = poisson.rvs(mu=away_lambda, size=n_sims)
-        
-        home_wins = float((home_goals > away_goals).mean())
-        draws = float((home_goals == away_goals).mean())
-        away_wins = float((home_goals < away_goals).mean())
-        
+
+        draws = float(skellam.pmf(0, home_lambda, away_lambda))
+        away_wins = float(skellam.cdf(-1, home_lambda, away_lambda))
+        home_wins = max(0.0, 1.0 - draws - away_wins)
+
         return {
             'home_team': home_team,
             'away_team': away_team,
@@ -198,33 +369,150 @@ class WorldCupPredictor:
             'expected_home_goals': home_goals_pred,
             'expected_away_goals': away_goals_pred,
         }
+
+    def predict_match(
+        self,
+        home_team: str,
+        away_team: str,
+        is_neutral: bool = True,
+        is_world_cup: bool = True
+    ) -> Optional[dict]:
+        """
+        Predict a match between two teams with full probability distribution.
+
+        Returns dict with:
+        - home_win_prob, draw_prob, away_win_prob
+        - expected_home_goals, expected_away_goals
+        """
+        self.load_models()
+
+        vec = self._feature_vector(home_team, away_team, is_neutral, is_world_cup)
+        if vec is None:
+            return None
+
+        features = vec[np.newaxis, :]
+        home_goals_pred = float(
+            self._booster_home.inplace_predict(features, iteration_range=self._iter_home)[0]
+        )
+        away_goals_pred = float(
+            self._booster_away.inplace_predict(features, iteration_range=self._iter_away)[0]
+        )
+
+        return self._match_outcome(
+            home_team, away_team, home_goals_pred, away_goals_pred
+        )
+
+    def predict_matches(
+        self,
+        matches: List[Tuple[str, str, bool, bool]]
+    ) -> List[Optional[dict]]:
+        """
+        Predict many matches with a single batched model call.
+
+        Args:
+            matches: list of (home_team, away_team, is_neutral, is_world_cup)
+
+        Returns one result dict per input match (None where player data is
+        missing), in input order. Amortizes the XGBoost predict overhead
+        across the whole batch instead of paying it per match.
+        """
+        self.load_models()
+
+        results: List[Optional[dict]] = [None] * len(matches)
+        rows = []
+        row_indices = []
+        for i, (home_team, away_team, is_neutral, is_world_cup) in enumerate(matches):
+            vec = self._feature_vector(home_team, away_team, is_neutral, is_world_cup)
+            if vec is not None:
+                rows.append(vec)
+                row_indices.append(i)
+
+        if not rows:
+            return results
+
+        features = np.stack(rows)
+        home_preds = self._booster_home.inplace_predict(features, iteration_range=self._iter_home)
+        away_preds = self._booster_away.inplace_predict(features, iteration_range=self._iter_away)
+
+        for row_pos, i in enumerate(row_indices):
+            home_team, away_team = matches[i][0], matches[i][1]
+            results[i] = self._match_outcome(
+                home_team, away_team,
+                float(home_preds[row_pos]), float(away_preds[row_pos])
+            )
+
+        return results
     
+    def _tournament_match_probs(
+        self,
+        teams: List[str]
+    ) -> Dict[Tuple[str, str], Optional[dict]]:
+        """
+        Precompute match predictions for every pair of tournament teams.
+
+        One batched model call covers all pairs, so the Monte Carlo loop can
+        replay thousands of matches as dict lookups instead of re-running the
+        predictor per match per simulation. Both orientations are predicted
+        (2x rows, still a single batch): the model carries a home-slot bias
+        even with is_neutral set, so the reversed fixture is a genuine
+        prediction, not a mirror of the forward one.
+
+        Predictions are deterministic per pair, so they are memoized in
+        _pair_prob_cache: repeated simulations of the same (or overlapping)
+        brackets only ever predict a pair once per process.
+        """
+        teams = list(dict.fromkeys(teams))
+        pairs = [(a, b) for i, a in enumerate(teams) for b in teams[i + 1:]]
+
+        cache = self._pair_prob_cache
+        missing = [pair for pair in pairs if pair not in cache]
+        if missing:
+            matches = []
+            for a, b in missing:
+                matches.append((a, b, True, True))
+                matches.append((b, a, True, True))
+            results = self.predict_matches(matches)
+            for (a, b), forward, reverse in zip(missing, results[0::2], results[1::2]):
+                cache[(a, b)] = forward
+                cache[(b, a)] = reverse
+
+        probs: Dict[Tuple[str, str], Optional[dict]] = {}
+        for a, b in pairs:
+            probs[(a, b)] = cache[(a, b)]
+            probs[(b, a)] = cache[(b, a)]
+        return probs
+
     def simulate_group_stage(
         self,
         groups: Dict[str, List[str]],
-        n_sims: int = 1000
+        match_probs: Optional[Dict[Tuple[str, str], Optional[dict]]] = None
     ) -> Dict[str, List[Tuple[str, dict]]]:
         """
         Simulate group stage matches and return standings.
-        
-        Returns dict mapping group name to list of (team, stats) tuples sorted by standing.
+
+        Returns dict mapping group name to list of (team, stats) tuples sorted
+        by standing. Pass precomputed match_probs (from
+        _tournament_match_probs) to replay matches without re-predicting.
         """
         self.load_models()
         group_results = {}
-        
+
         for group_name, teams in groups.items():
             standings = {team: {'points': 0, 'gd': 0, 'gf': 0, 'wins': 0} for team in teams}
-            
+
             # Play all group matches (round robin)
             for i, team_a in enumerate(teams):
                 for team_b in teams[i+1:]:
-                    result = self.predict_match(team_a, team_b, n_sims=n_sims)
-                    
+                    if match_probs is not None:
+                        result = match_probs.get((team_a, team_b))
+                    else:
+                        result = self.predict_match(team_a, team_b)
+
                     if result is None:
                         continue
                     
                     # Simulate single match outcome from probabilities
-                    rand = np.random.random()
+                    rand = self._rng.random()
                     if rand < result['home_win_prob']:
                         standings[team_a]['points'] += 3
                         standings[team_a]['wins'] += 1
@@ -255,10 +543,18 @@ class WorldCupPredictor:
         
         return group_results
     
-    def simulate_knockout_match(self, team_a: str, team_b: str, n_sims: int = 1000) -> str:
+    def simulate_knockout_match(
+        self,
+        team_a: str,
+        team_b: str,
+        match_probs: Optional[Dict[Tuple[str, str], Optional[dict]]] = None
+    ) -> str:
         """Simulate a knockout match (no draws allowed). Returns winner."""
-        result = self.predict_match(team_a, team_b, n_sims=n_sims)
-        
+        if match_probs is not None:
+            result = match_probs.get((team_a, team_b))
+        else:
+            result = self.predict_match(team_a, team_b)
+
         if result is None:
             # Fallback: use Elo to decide
             return team_a if self.elo_ratings.get(team_a, 1500) > self.elo_ratings.get(team_b, 1500) else team_b
@@ -266,7 +562,7 @@ class WorldCupPredictor:
         # For knockouts, add half of draw probability to each team
         adj_home_win = result['home_win_prob'] + result['draw_prob'] / 2
         
-        if np.random.random() < adj_home_win:
+        if self._rng.random() < adj_home_win:
             return team_a
         else:
             return team_b
@@ -365,106 +661,321 @@ class WorldCupPredictor:
         # Ensure we have exactly 16 pairs for Round of 32
         return pairs[:16]
     
+    # Simulations per vectorized batch; also the granularity at which the
+    # time budget is checked.
+    _SIM_CHUNK = 1024
+
+    def _pair_tables(
+        self,
+        team_index: Dict[str, int],
+        match_probs: Dict[Tuple[str, str], Optional[dict]]
+    ) -> dict:
+        """
+        Build dense per-pair lookup tables from the precomputed predictions.
+
+        Entry [i, j] describes team i at home against team j: outcome
+        probabilities, expected goals, and the draw-adjusted knockout win
+        probability (with the Elo fallback baked in for pairs without a
+        prediction). Dense arrays let the vectorized simulation resolve a
+        match for every simulation at once with one fancy-indexed lookup.
+        """
+        n = len(team_index)
+        p_home = np.zeros((n, n), dtype=np.float32)
+        p_draw = np.zeros((n, n), dtype=np.float32)
+        adj_home = np.zeros((n, n), dtype=np.float32)
+        goals_home = np.zeros((n, n), dtype=np.float32)
+        goals_away = np.zeros((n, n), dtype=np.float32)
+        valid = np.zeros((n, n), dtype=bool)
+
+        for (team_a, team_b), result in match_probs.items():
+            i, j = team_index[team_a], team_index[team_b]
+            if result is None:
+                # Same fallback as simulate_knockout_match: higher Elo wins
+                elo_a = self.elo_ratings.get(team_a, 1500)
+                elo_b = self.elo_ratings.get(team_b, 1500)
+                adj_home[i, j] = 1.0 if elo_a > elo_b else 0.0
+                continue
+            p_home[i, j] = result['home_win_prob']
+            p_draw[i, j] = result['draw_prob']
+            adj_home[i, j] = result['home_win_prob'] + result['draw_prob'] / 2
+            goals_home[i, j] = result['expected_home_goals']
+            goals_away[i, j] = result['expected_away_goals']
+            valid[i, j] = True
+
+        return {
+            'p_home': p_home,
+            'p_draw': p_draw,
+            'adj_home': adj_home,
+            'goals_home': goals_home,
+            'goals_away': goals_away,
+            'valid': valid,
+        }
+
+    @staticmethod
+    def _knockout_round_vec(
+        home_ids: np.ndarray,
+        away_ids: np.ndarray,
+        tables: dict,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """Resolve one knockout match per column across all simulations."""
+        p = tables['adj_home'][home_ids, away_ids]
+        return np.where(rng.random(home_ids.shape) < p, home_ids, away_ids)
+
+    def _group_stage_vec(
+        self,
+        group_ids: Dict[str, np.ndarray],
+        tables: dict,
+        n_sims: int,
+        rng: np.random.Generator
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Play every group's round robin across all simulations simultaneously.
+
+        Returns per group (ranked team ids, ranked points, ranked goal diff),
+        each of shape (n_sims, group_size) ordered best-first.
+        """
+        p_home, p_draw = tables['p_home'], tables['p_draw']
+        goals_home, goals_away = tables['goals_home'], tables['goals_away']
+        valid = tables['valid']
+
+        standings = {}
+        for group_name, ids in group_ids.items():
+            k = len(ids)
+            points = np.zeros((n_sims, k), dtype=np.int16)
+            gd = np.zeros((n_sims, k), dtype=np.float32)
+            gf = np.zeros((n_sims, k), dtype=np.float32)
+
+            for x in range(k):
+                for y in range(x + 1, k):
+                    i, j = ids[x], ids[y]
+                    if not valid[i, j]:
+                        continue
+                    r = rng.random(n_sims)
+                    home_win = r < p_home[i, j]
+                    draw = ~home_win & (r < p_home[i, j] + p_draw[i, j])
+                    away_win = ~home_win & ~draw
+                    points[:, x] += 3 * home_win + draw
+                    points[:, y] += 3 * away_win + draw
+                    # Expected goals always accrue to goals-for; goal diff
+                    # only moves on decisive results (same bookkeeping as
+                    # the scalar group stage).
+                    decisive = ~draw
+                    gd[:, x] += (goals_home[i, j] - goals_away[i, j]) * decisive
+                    gd[:, y] += (goals_away[i, j] - goals_home[i, j]) * decisive
+                    gf[:, x] += goals_home[i, j]
+                    gf[:, y] += goals_away[i, j]
+
+            # Rank by (points, gd, gf) descending for every sim at once
+            order = np.lexsort((gf, gd, points))[:, ::-1]
+            standings[group_name] = (
+                ids[order],
+                np.take_along_axis(points, order, axis=1),
+                np.take_along_axis(gd, order, axis=1),
+            )
+
+        return standings
+
+    def _build_48_team_brackets_vec(
+        self,
+        groups: Dict[str, List[str]],
+        standings: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        n_sims: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build every simulation's Round of 32 bracket.
+
+        The FIFA 48-team pairing rules are collision-dependent (a consumed
+        runner-up falls back to a best-third slot), so the pairing itself is
+        a per-sim loop over small int lists; the heavy work around it --
+        standings, third-place ranking, match resolution -- is vectorized.
+        """
+        group_names = list(groups)
+
+        # Rank third-placed teams by (points, gd) across all sims at once
+        ids3 = np.stack([standings[g][0][:, 2] for g in group_names], axis=1)
+        pts3 = np.stack([standings[g][1][:, 2] for g in group_names], axis=1)
+        gd3 = np.stack([standings[g][2][:, 2] for g in group_names], axis=1)
+        order3 = np.lexsort((gd3, pts3))[:, ::-1][:, :8]
+        best_third = np.take_along_axis(ids3, order3, axis=1).tolist()
+
+        winner_lists = {g: standings[g][0][:, 0].tolist() for g in group_names}
+        runner_lists = {g: standings[g][0][:, 1].tolist() for g in group_names}
+        sorted_names = sorted(group_names)
+
+        home = np.empty((n_sims, 16), dtype=np.intp)
+        away = np.empty((n_sims, 16), dtype=np.intp)
+        for s in range(n_sims):
+            winners = {g: winner_lists[g][s] for g in group_names}
+            runners = {g: runner_lists[g][s] for g in group_names}
+            thirds = best_third[s]
+            pairs = []
+            used = set()
+            third_idx = 0
+
+            # Matches 1-8: winners A-H vs cross-group runners-up, falling
+            # back to a best-third slot when the runner-up is taken
+            for block in (('A', 'B', 'C', 'D'), ('E', 'F', 'G', 'H')):
+                opponents = (block[1], block[0], block[3], block[2])
+                for group, opponent_group in zip(block, opponents):
+                    if runners[opponent_group] not in used:
+                        pairs.append((winners[group], runners[opponent_group]))
+                        used.add(winners[group])
+                        used.add(runners[opponent_group])
+                    elif third_idx < len(thirds):
+                        pairs.append((winners[group], thirds[third_idx]))
+                        used.add(winners[group])
+                        used.add(thirds[third_idx])
+                        third_idx += 1
+
+            # Matches 9-12: winners I-L vs runners-up
+            pairs.append((winners['I'], runners['J']))
+            pairs.append((winners['J'], runners['I']))
+            pairs.append((winners['K'], runners['L']))
+            pairs.append((winners['L'], runners['K']))
+            used.update((winners['I'], winners['J'], winners['K'], winners['L'],
+                         runners['I'], runners['J'], runners['K'], runners['L']))
+
+            # Matches 13-16: remaining runners-up and best-third teams
+            remaining = [runners[g] for g in sorted_names if runners[g] not in used]
+            remaining += [t for t in thirds if t not in used]
+            for i in range(0, len(remaining) - 1, 2):
+                pairs.append((remaining[i], remaining[i + 1]))
+
+            for m, (h, a) in enumerate(pairs[:16]):
+                home[s, m] = h
+                away[s, m] = a
+
+        return home, away
+
+    def _simulate_chunk(
+        self,
+        groups: Dict[str, List[str]],
+        group_ids: Dict[str, np.ndarray],
+        tables: dict,
+        tournament_format: str,
+        n_sims: int,
+        rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Simulate n_sims complete tournaments in one vectorized pass.
+
+        Returns (champion ids (n_sims,), finalist ids (n_sims, 2),
+        semifinalist ids (n_sims, 4)).
+        """
+        standings = self._group_stage_vec(group_ids, tables, n_sims, rng)
+
+        if tournament_format == "32_team":
+            # Same pairing order as _create_32_team_bracket
+            first_home = np.stack(
+                [standings[g][0][:, 0] for g in ('A', 'C', 'E', 'G', 'B', 'D', 'F', 'H')],
+                axis=1,
+            )
+            first_away = np.stack(
+                [standings[g][0][:, 1] for g in ('B', 'D', 'F', 'H', 'A', 'C', 'E', 'G')],
+                axis=1,
+            )
+        else:
+            first_home, first_away = self._build_48_team_brackets_vec(groups, standings, n_sims)
+
+        current = self._knockout_round_vec(first_home, first_away, tables, rng)
+        while current.shape[1] > 8:
+            current = self._knockout_round_vec(current[:, 0::2], current[:, 1::2], tables, rng)
+        # Quarter-final winners reach the semis, semi-final winners the final
+        semifinalists = self._knockout_round_vec(current[:, 0::2], current[:, 1::2], tables, rng)
+        finalists = self._knockout_round_vec(semifinalists[:, 0::2], semifinalists[:, 1::2], tables, rng)
+        champions = self._knockout_round_vec(finalists[:, 0:1], finalists[:, 1:2], tables, rng)[:, 0]
+        return champions, finalists, semifinalists
+
     def simulate_tournament(
         self,
         groups: Dict[str, List[str]],
         tournament_format: str = "32_team",
-        n_tournament_sims: int = 100
+        n_tournament_sims: int = 100,
+        time_budget_s: Optional[float] = None
     ) -> dict:
         """
         Run full tournament simulation multiple times.
-        
+
+        All simulations advance together through each stage as NumPy arrays
+        (one row per simulation), so per-sim work is a handful of vectorized
+        draws and lookups rather than a Python replay of the whole bracket.
+
         Args:
             groups: Dict mapping group name to list of team names
             tournament_format: "32_team" (8 groups) or "48_team" (12 groups)
             n_tournament_sims: Number of tournament simulations to run
-        
+            time_budget_s: optional wall-clock budget; simulation stops early
+                once exceeded and reports the sims actually completed
+
         Returns dict with:
             - champions: dict of team -> win count
             - finalists: dict of team -> finals appearance count
             - semifinalists: dict of team -> semifinal appearance count
+            - n_sims: number of simulations actually run
         """
         self.load_models()
-        
-        use_third_place = tournament_format == "48_team"
-        
-        champions = Counter()
-        finalists = Counter()
-        semifinalists = Counter()
-        
-        for _ in range(n_tournament_sims):
-            # Simulate group stage
-            group_results = self.simulate_group_stage(groups)
-            
-            # Determine third-place teams for 48-team format
-            third_place = []
-            for group_name, standings in group_results.items():
-                if use_third_place and len(standings) > 2:
-                    third_place.append((
-                        standings[2][0],
-                        standings[2][1]['points'],
-                        standings[2][1]['gd'],
-                        group_name
-                    ))
-            
-            # Sort third-place teams for 48-team format
-            if use_third_place:
-                third_place.sort(key=lambda x: (x[1], x[2]), reverse=True)
-            
-            # Create bracket pairs following FIFA rules
-            if tournament_format == "32_team":
-                bracket_pairs = self._create_32_team_bracket(group_results)
-            else:  # 48_team
-                bracket_pairs = self._create_48_team_bracket(group_results, third_place)
-            
-            # Simulate Round of 32 (or Round of 16 for 32-team)
-            current_round = [
-                self.simulate_knockout_match(pair[0], pair[1])
-                for pair in bracket_pairs
-            ]
-            
-            # Determine rounds based on format
-            if tournament_format == "48_team":
-                round_names = ['Round of 32', 'Round of 16', 'Quarter Finals', 'Semi Finals', 'Final']
-            else:
-                round_names = ['Round of 16', 'Quarter Finals', 'Semi Finals', 'Final']
-            
-            # Start from Round of 16 (or Round of 32 for 48-team)
-            round_start_idx = 1 if tournament_format == "48_team" else 0
-            
-            for round_idx, round_name in enumerate(round_names[round_start_idx:-1], round_start_idx):
-                next_round = []
-                for i in range(0, len(current_round), 2):
-                    if i + 1 < len(current_round):
-                        winner = self.simulate_knockout_match(current_round[i], current_round[i+1])
-                        next_round.append(winner)
-                        
-                        if round_name == 'Quarter Finals':
-                            semifinalists[winner] += 1
-                        if round_name == 'Semi Finals':
-                            finalists[winner] += 1
-                
-                current_round = next_round
-            
-            # Final
-            if len(current_round) >= 2:
-                champion = self.simulate_knockout_match(current_round[0], current_round[1])
-                champions[champion] += 1
-        
+
+        team_index = {}
+        for teams in groups.values():
+            for team in teams:
+                if team not in team_index:
+                    team_index[team] = len(team_index)
+        index_team = list(team_index)
+        n_teams = len(team_index)
+
+        # One batched prediction pass over every possible pairing, expanded
+        # into dense lookup tables for the vectorized engine.
+        match_probs = self._tournament_match_probs(index_team)
+        tables = self._pair_tables(team_index, match_probs)
+        group_ids = {
+            group: np.array([team_index[team] for team in teams])
+            for group, teams in groups.items()
+        }
+
+        champion_counts = np.zeros(n_teams, dtype=np.int64)
+        finalist_counts = np.zeros(n_teams, dtype=np.int64)
+        semifinalist_counts = np.zeros(n_teams, dtype=np.int64)
+
+        rng = self._rng
+        deadline = (
+            time.perf_counter() + time_budget_s if time_budget_s is not None else None
+        )
+        sims_done = 0
+        while sims_done < n_tournament_sims:
+            chunk = min(self._SIM_CHUNK, n_tournament_sims - sims_done)
+            champions, finalists, semifinalists = self._simulate_chunk(
+                groups, group_ids, tables, tournament_format, chunk, rng
+            )
+            champion_counts += np.bincount(champions, minlength=n_teams)
+            finalist_counts += np.bincount(finalists.ravel(), minlength=n_teams)
+            semifinalist_counts += np.bincount(semifinalists.ravel(), minlength=n_teams)
+            sims_done += chunk
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
         return {
-            'champions': dict(champions),
-            'finalists': dict(finalists),
-            'semifinalists': dict(semifinalists),
-            'n_sims': n_tournament_sims
+            'champions': {index_team[i]: int(c) for i, c in enumerate(champion_counts) if c},
+            'finalists': {index_team[i]: int(c) for i, c in enumerate(finalist_counts) if c},
+            'semifinalists': {index_team[i]: int(c) for i, c in enumerate(semifinalist_counts) if c},
+            'n_sims': sims_done
         }
-    
-    def get_knockout_win_probability(self, team_a: str, team_b: str) -> Tuple[str, float]:
+
+    def get_knockout_win_probability(
+        self,
+        team_a: str,
+        team_b: str,
+        match_probs: Optional[Dict[Tuple[str, str], Optional[dict]]] = None
+    ) -> Tuple[str, float]:
         """
         Calculate the probability of team_a winning a knockout match against team_b.
         Returns (winner, win_probability) where winner is the team with higher probability.
         """
-        result = self.predict_match(team_a, team_b, n_sims=10000)
-        
+        if match_probs is not None:
+            result = match_probs.get((team_a, team_b))
+        else:
+            result = self.predict_match(team_a, team_b)
+
         if result is None:
             # Fallback: use Elo to decide
             elo_a = self.elo_ratings.get(team_a, 1500)
@@ -485,7 +996,8 @@ class WorldCupPredictor:
     
     def simulate_deterministic_group_stage(
         self,
-        groups: Dict[str, List[str]]
+        groups: Dict[str, List[str]],
+        match_probs: Optional[Dict[Tuple[str, str], Optional[dict]]] = None
     ) -> Dict[str, List[Tuple[str, dict]]]:
         """
         Simulate group stage deterministically (no randomness).
@@ -493,15 +1005,18 @@ class WorldCupPredictor:
         """
         self.load_models()
         group_results = {}
-        
+
         for group_name, teams in groups.items():
             standings = {team: {'points': 0, 'gd': 0, 'gf': 0, 'wins': 0} for team in teams}
-            
+
             # Play all group matches (round robin)
             for i, team_a in enumerate(teams):
                 for team_b in teams[i+1:]:
-                    result = self.predict_match(team_a, team_b, n_sims=10000)
-                    
+                    if match_probs is not None:
+                        result = match_probs.get((team_a, team_b))
+                    else:
+                        result = self.predict_match(team_a, team_b)
+
                     if result is None:
                         continue
                     
@@ -553,11 +1068,16 @@ class WorldCupPredictor:
         The winner of each match is the team with the higher win probability.
         """
         self.load_models()
-        
+
         use_third_place = tournament_format == "48_team"
-        
+
+        # One batched prediction pass shared by the group stage and every
+        # knockout round below
+        all_teams = [team for teams in groups.values() for team in teams]
+        match_probs = self._tournament_match_probs(all_teams)
+
         # Simulate group stage deterministically
-        group_results = self.simulate_deterministic_group_stage(groups)
+        group_results = self.simulate_deterministic_group_stage(groups, match_probs=match_probs)
         
         # Format group results for output
         formatted_groups = {}
@@ -600,7 +1120,7 @@ class WorldCupPredictor:
         first_round_matches = []
         current_round_teams = []
         for team_a, team_b in bracket_pairs:
-            winner, win_prob = self.get_knockout_win_probability(team_a, team_b)
+            winner, win_prob = self.get_knockout_win_probability(team_a, team_b, match_probs=match_probs)
             first_round_matches.append({
                 'team_a': team_a,
                 'team_b': team_b,
@@ -618,7 +1138,7 @@ class WorldCupPredictor:
                 if i + 1 < len(current_round_teams):
                     team_a = current_round_teams[i]
                     team_b = current_round_teams[i + 1]
-                    winner, win_prob = self.get_knockout_win_probability(team_a, team_b)
+                    winner, win_prob = self.get_knockout_win_probability(team_a, team_b, match_probs=match_probs)
                     r16_matches.append({
                         'team_a': team_a,
                         'team_b': team_b,
@@ -636,7 +1156,7 @@ class WorldCupPredictor:
             if i + 1 < len(current_round_teams):
                 team_a = current_round_teams[i]
                 team_b = current_round_teams[i + 1]
-                winner, win_prob = self.get_knockout_win_probability(team_a, team_b)
+                winner, win_prob = self.get_knockout_win_probability(team_a, team_b, match_probs=match_probs)
                 qf_matches.append({
                     'team_a': team_a,
                     'team_b': team_b,
@@ -653,7 +1173,7 @@ class WorldCupPredictor:
             if i + 1 < len(sf_teams):
                 team_a = sf_teams[i]
                 team_b = sf_teams[i + 1]
-                winner, win_prob = self.get_knockout_win_probability(team_a, team_b)
+                winner, win_prob = self.get_knockout_win_probability(team_a, team_b, match_probs=match_probs)
                 sf_matches.append({
                     'team_a': team_a,
                     'team_b': team_b,
@@ -667,7 +1187,7 @@ class WorldCupPredictor:
         if len(final_teams) >= 2:
             team_a = final_teams[0]
             team_b = final_teams[1]
-            winner, win_prob = self.get_knockout_win_probability(team_a, team_b)
+            winner, win_prob = self.get_knockout_win_probability(team_a, team_b, match_probs=match_probs)
             bracket['final'] = {
                 'team_a': team_a,
                 'team_b': team_b,
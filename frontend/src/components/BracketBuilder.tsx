@@ -145,12 +145,17 @@ export function BracketBuilder({ teams }: BracketBuilderProps) {
 			setGroups(preset.groups);
 			setPresetName(preset.name);
 
-			// If preset has pre-computed results, show them
+			// If preset has pre-computed results, show them (presets store
+			// histograms as dicts; convert to the sorted-pairs shape the
+			// simulation endpoint returns)
+			const toSortedPairs = (counts: { [team: string]: number }) =>
+				Object.entries(counts).sort(([, a], [, b]) => b - a);
+
 			if (preset.champions) {
 				setResults({
-					champions: preset.champions,
-					finalists: preset.finalists || {},
-					semifinalists: preset.semifinalists || {},
+					champions: toSortedPairs(preset.champions),
+					finalists: toSortedPairs(preset.finalists || {}),
+					semifinalists: toSortedPairs(preset.semifinalists || {}),
 					n_sims: preset.metadata?.n_sims || 1000,
 				});
 			} else {
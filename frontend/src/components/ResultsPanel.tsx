@@ -24,10 +24,8 @@ export function ResultsPanel({
 		return null;
 	}
 
-	// Sort champions by count and get probabilities
-	const sortedChampions = Object.entries(results.champions)
-		.sort(([, a], [, b]) => b - a)
-		.slice(0, 15);
+	// Champions arrive presorted by count (descending) from the server
+	const sortedChampions = results.champions.slice(0, 15);
 
 	const maxCount = sortedChampions[0]?.[1] || 1;
 
@@ -66,12 +64,11 @@ export function ResultsPanel({
 				})}
 			</div>
 
-			{results.finalists && Object.keys(results.finalists).length > 0 && (
+			{results.finalists && results.finalists.length > 0 && (
 				<div className="secondary-results">
 					<h3>Most Likely Finalists</h3>
 					<div className="finalists-list">
-						{Object.entries(results.finalists)
-							.sort(([, a], [, b]) => b - a)
+						{results.finalists
 							.slice(0, 8)
 							.map(([team, count]) => (
 								<div key={team} className="finalist-item">
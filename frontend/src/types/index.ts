@@ -32,10 +32,13 @@ export interface Bracket {
 	champion: string;
 }
 
+// (team, count) pairs sorted by count descending (server-side)
+export type TeamCount = [string, number];
+
 export interface SimulationResult {
-	champions: { [team: string]: number };
-	finalists: { [team: string]: number };
-	semifinalists: { [team: string]: number };
+	champions: TeamCount[];
+	finalists: TeamCount[];
+	semifinalists: TeamCount[];
 	n_sims: number;
 	// New bracket data
 	group_results?: { [group: string]: GroupStanding[] };